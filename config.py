@@ -26,20 +26,63 @@
 #
 # Modified by E.D.G
 
+import glob
 import os
-import subprocess
-import requests 
-
-from libqtile import hook
+import time
 from typing import List  
 from libqtile import bar, layout, widget
 from libqtile.config import Click, Drag, Group, Key, Match, Screen
 from libqtile.lazy import lazy
-from libqtile.utils import guess_terminal
 
 mod = "mod4"
 terminal = "terminator" 
 
+###Backlight###
+# Write the brightness straight to sysfs instead of going through xbacklight/RandR.
+# Needs write access to /sys/class/backlight/*/brightness (video group or an udev rule).
+# Set backlight_name (e.g. "intel_backlight") to force a device; None picks one automatically.
+backlight_name = None
+
+def find_backlight():
+    if backlight_name is not None:
+        return "/sys/class/backlight/" + backlight_name
+    # Prefer the native raw/platform interfaces: acpi_video* (firmware) is often the one that does nothing.
+    preference = {"raw": 0, "platform": 1, "firmware": 2}
+    def rank(device):
+        try:
+            with open(device + "/type") as f:
+                return preference.get(f.read().strip(), 3), device
+        except OSError:
+            return 3, device
+    return min(glob.glob("/sys/class/backlight/*"), key=rank, default=None)
+
+backlight_device = find_backlight()
+backlight_max = None
+
+def change_backlight(qtile, percent):
+    global backlight_max
+    try:
+        if backlight_device is None:
+            raise FileNotFoundError("no backlight device")
+        if backlight_max is None:
+            with open(backlight_device + "/max_brightness") as f:
+                backlight_max = int(f.read())
+        with open(backlight_device + "/brightness") as f:
+            current = int(f.read())
+        step = max(1, backlight_max * abs(percent) // 100)
+        new = min(max(current + (step if percent > 0 else -step), 0), backlight_max)
+        if new != current:
+            with open(backlight_device + "/brightness", "w") as f:
+                f.write(str(new))
+    except OSError:  # no device or no write permission, fall back to xbacklight
+        qtile.cmd_spawn("xbacklight {} {}".format("-inc" if percent > 0 else "-dec", abs(percent)))
+
+###Screenshots###
+# Build the file name here so that `import` is spawned without an extra shell.
+def take_screenshot(qtile):
+    path = os.path.expanduser(time.strftime("~/Screenshots/%Y%m%d-%H%M%S.jpg"))
+    qtile.cmd_spawn(["import", "-window", "root", path])
+
 ###Keys###      
 keys = [
     # Important: remind existing of a list of available commands that can be bound to keys can be found
@@ -98,7 +141,7 @@ keys = [
     Key([mod], "d", lazy.spawn("code"), desc="Spawn code"),
     Key([mod], "n", lazy.spawn("nitrogen"), desc="Spawn nitrogen"),
     Key([mod], "u", lazy.spawn('terminator -e "unimatrix -s 93 -a -f -o"'), desc="Spawn unimatrix"),
-    Key([mod], "p", lazy.spawn('terminator -e "cd /opt/pycharm-community-2021.3/bin;./pycharm.sh"'), desc="Spawn pycharm"),
+    Key([mod], "p", lazy.spawn('/opt/pycharm-community-2021.3/bin/pycharm.sh'), desc="Spawn pycharm"),
     Key([mod], "t", lazy.spawn('thunar'), desc="Spawn thunar"),
     Key([mod], "o", lazy.spawn('libreoffice'), desc="Spawn libreoffice"),
     Key([mod], "b", lazy.spawn('thunderbird'), desc="Spawn thunderbird"),
@@ -123,15 +166,15 @@ keys = [
     Key([], "XF86AudioNext", lazy.spawn('playerctl next'), desc="Play-Pause"),
     Key([], "XF86AudioPrev", lazy.spawn('playerctl previous'), desc="Play-Pause"),
  
-    Key([], "XF86MonBrightnessDown", lazy.spawn('xbacklight -dec 10'), desc="Bright down"),
-    Key([], "XF86MonBrightnessUp", lazy.spawn('xbacklight -inc 10'), desc="Bright up"),
+    Key([], "XF86MonBrightnessDown", lazy.function(change_backlight, -10), desc="Bright down"),
+    Key([], "XF86MonBrightnessUp", lazy.function(change_backlight, 10), desc="Bright up"),
 
     Key([], "XF86Display", lazy.spawn('arandr'), desc="Display"),
 
 
     Key([], "XF86Bluetooth", lazy.spawn('blueman-applet'), desc="Bluetooth"), 
 
-    Key([], "Print", lazy.spawn('sh -c "import -window root ~/Screenshots/$(date "+%Y%m%d-%H%M%S").jpg"'), desc="Screenshot"),
+    Key([], "Print", lazy.function(take_screenshot), desc="Screenshot"),
     Key(["control"], "Print", lazy.spawn('spectacle'), desc="Spectacle"), #Also a like use spectacle for my screenshots
 ]
 
@@ -241,7 +284,7 @@ screens = [
                             margin = 3,
                             #margin_x = 0 ,
                             #margin_y = 0,
-                            mouse_callbacks = {"Button1": lazy.spawn('terminator -e "cd /opt/pycharm-community-2021.3/bin;./pycharm.sh"')}
+                            mouse_callbacks = {"Button1": lazy.spawn('/opt/pycharm-community-2021.3/bin/pycharm.sh')}
                             ),
 
                         widget.Image( #Visual Code
@@ -369,7 +412,7 @@ screens = [
                             text = "",    
                             fontsize = 30,
                             padding = 5,
-                            mouse_callbacks = {"Button1": lazy.spawn('terminator -e "cd /run/media/edu/Samsung_T5/ && setsid thunar "')}  ##thunar --new-window run/media/edu/Samsung_T5/
+                            mouse_callbacks = {"Button1": lazy.spawn('thunar /run/media/edu/Samsung_T5/')}
                             ),
                             
                         widget.TextBox(  #button that open my Desktop
@@ -377,7 +420,7 @@ screens = [
                             text = "",    
                             fontsize = 26,
                             padding = 5,
-                            mouse_callbacks = {"Button1": lazy.spawn('terminator -e "cd /home/edu/Desktop && setsid thunar "')}  
+                            mouse_callbacks = {"Button1": lazy.spawn('thunar /home/edu/Desktop')}
                             ),
                             
                         widget.TextBox(
@@ -385,7 +428,7 @@ screens = [
                             text = "",
                             fontsize = 25,
                             padding = 5,
-                            mouse_callbacks = {"Button1": lazy.spawn('terminator -e "cd /home/edu/Desktop/Medicina && setsid thunar "')}
+                            mouse_callbacks = {"Button1": lazy.spawn('thunar /home/edu/Desktop/Medicina')}
                             ),
                             
                         widget.TextBox(
@@ -393,7 +436,7 @@ screens = [
                             text = "",
                             fontsize = 25,
                             padding = 5,
-                            mouse_callbacks = {"Button1": lazy.spawn('terminator -e "cd /home/edu/Desktop/Medicina/Calendario && setsid thunar "')}
+                            mouse_callbacks = {"Button1": lazy.spawn('thunar /home/edu/Desktop/Medicina/Calendario')}
                         ),
                     ]
                 ), 
@@ -403,6 +446,7 @@ screens = [
                 ),      
                 widget.Clock( 
                     format ='%A, %d/%m/%Y',
+                    update_interval = 60, #Only the date is shown, no need to wake up every second
                     padding = 5,
                     mouse_callbacks = {"Button1": lazy.spawn('terminator -e "calcurse"')}
                 ),                            